@@ -1,6 +1,6 @@
 from .executor import Executor
 from .scheduler import Scheduler
-from .task import Task, TaskStatus
+from .task import Task, TaskOutcome, TaskStatus
 
 
-__all__ = ['Task', 'TaskStatus', 'Scheduler', 'Executor']
\ No newline at end of file
+__all__ = ['Task', 'TaskOutcome', 'TaskStatus', 'Scheduler', 'Executor']
\ No newline at end of file
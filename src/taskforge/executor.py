@@ -1,6 +1,11 @@
-from concurrent.futures.thread import ThreadPoolExecutor
+from collections import defaultdict
+from .pool import WorkStealingPool
 from .scheduler import Scheduler
-from typing import Dict
+from .task import Task
+from typing import Callable, Dict, List, Optional
+
+
+_NO_TAG = object()  # Marks the last-tag caches as empty, None is a valid tag
 
 
 class Executor:
@@ -9,25 +14,44 @@ class Executor:
         self.__scheduler: Scheduler = scheduler
         self.__workers_per_tag = workers_per_tag
 
-        self.__tag_to_thread_pool: Dict[str, ThreadPoolExecutor] = {}
+        self.__tag_to_pool: Dict[str, WorkStealingPool] = {}
+        self.__last_tag: object = _NO_TAG  # Tag of the most recent lookup, consecutive tasks usually share it
+        self.__last_pool: Optional[WorkStealingPool] = None
+
+
+    def __ensure_pool(self, tag: str) -> WorkStealingPool:
+        if tag is self.__last_tag:
+            return self.__last_pool
+
+        if tag not in self.__tag_to_pool:
+            self.__tag_to_pool[tag] = WorkStealingPool(max_workers=self.__workers_per_tag, thread_name_prefix=tag)
+
+        self.__last_tag, self.__last_pool = tag, self.__tag_to_pool[tag]
+        return self.__last_pool
 
 
-    def __ensure_thread_pool(self, tag: str) -> ThreadPoolExecutor:
-        if tag not in self.__tag_to_thread_pool:
-            self.__tag_to_thread_pool[tag] = ThreadPoolExecutor(max_workers=self.__workers_per_tag, thread_name_prefix=tag)
+    def __submit(self, ready_tasks: List[Task]):
+        # Submit each tag's share of the batch to its pool in one go
+        tag_to_work: Dict[str, List[Callable[[], None]]] = defaultdict(list)
+        last_tag, work = _NO_TAG, None
+        for task in ready_tasks:
+            tag = task.tag()
+            if tag is not last_tag:  # Runs of same-tag tasks skip the dict lookup
+                last_tag, work = tag, tag_to_work[tag]
+            work.append(task.execute_task)
 
-        return self.__tag_to_thread_pool[tag]
+        for tag, work in tag_to_work.items():
+            self.__ensure_pool(tag).push_many(work)
 
 
     def run(self):
         try:
-            for task in self.__scheduler.ready_tasks:
-                thread_pool = self.__ensure_thread_pool(task.tag())
-                thread_pool.submit(task.execute_task)
+            for ready_tasks in self.__scheduler.ready_batches:
+                self.__submit(ready_tasks)
         finally:
             self.shutdown()
 
 
     def shutdown(self, wait: bool = True):
-        for thread_pool in self.__tag_to_thread_pool.values():
-            thread_pool.shutdown(wait=wait)
+        for pool in self.__tag_to_pool.values():
+            pool.shutdown(wait=wait)
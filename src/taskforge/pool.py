@@ -0,0 +1,155 @@
+from collections import deque
+from threading import Event, Lock, Thread, local
+from typing import Callable, List, Optional, Sequence
+import time
+
+
+class WorkStealingPool:
+    """
+    A set of up to max_workers threads where every worker owns a deque of pending work.
+    Workers take work from the front of their own deque and, once it runs dry, steal from the back of the others.
+    Deque appends and pops are atomic in CPython, so neither the submit nor the steal path takes a lock;
+    only starting a worker thread and a submitting thread's first push do.
+    Like ThreadPoolExecutor, threads are only started when submitted work finds no parked worker to run it.
+    """
+
+    # Number of extra passes over the deques an idle worker makes before blocking on its wakeup event
+    SPIN_ROUNDS = 16
+
+    # Upper bound on how many callables a single steal moves from a victim's deque
+    STEAL_LIMIT = 64
+
+    def __init__(self, max_workers: int, thread_name_prefix: str = '') -> None:
+        if max_workers <= 0:
+            raise ValueError("max_workers must be greater than 0")
+
+        self.__thread_name_prefix = thread_name_prefix
+        self.__deques: List[deque[Callable[[], None]]] = [deque() for _ in range(max_workers)]
+        self.__wakeups: List[Event] = [Event() for _ in range(max_workers)]  # Per-worker signal used to park idle workers
+        self.__idle: List[bool] = [False] * max_workers  # Whether a worker is parked (or about to park) on its event
+        self.__threads: List[Thread] = []  # Started workers, worker i runs on threads[i]
+        self.__lock = Lock()  # Guards starting workers and the round-robin cursor below against concurrent submitters
+        self.__submitter = local()  # Per-thread deque preference of submitting threads, see __submitter_worker
+        self.__next_submitter_worker: int = 0  # Round-robin cursor handing out deques to new submitting threads
+        self.__shutdown: bool = False
+
+    def push(self, fn: Callable[[], None]) -> None:
+        """
+        Queues fn on the owner end of the calling thread's preferred deque and wakes a worker to run it.
+        """
+        self.push_many((fn,))
+
+    def push_many(self, fns: Sequence[Callable[[], None]]) -> None:
+        """
+        Queues all of fns on the owner end of the calling thread's preferred deque in a single call.
+        Wakes one worker per queued callable - the owner first, then parked workers that can steal from it.
+        New workers are started when too few are parked and the pool has not reached max_workers yet.
+        """
+        if self.__shutdown:
+            raise RuntimeError("cannot schedule new work after shutdown")
+
+        worker = self.__submitter_worker()
+        self.__deques[worker].extendleft(reversed(fns))  # Owner pops from the left, keep fns in submission order
+        self.__wake(worker, len(fns))
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stops the workers once all queued work has been run. Blocks until they exit if wait is True.
+        """
+        self.__shutdown = True
+        for wakeup in self.__wakeups:
+            wakeup.set()
+
+        if wait:
+            for thread in self.__threads:
+                thread.join()
+
+    def __submitter_worker(self) -> int:
+        # Every submitting thread sticks to one deque, so concurrent submitters do not pile onto the same one.
+        # Workers submit onto their own deque, other threads get a deque assigned round-robin on first use.
+        worker = getattr(self.__submitter, 'worker', None)
+        if worker is None:
+            with self.__lock:
+                worker = self.__next_submitter_worker % len(self.__deques)
+                self.__next_submitter_worker = worker + 1
+            self.__submitter.worker = worker
+
+        return worker
+
+    def __start_worker(self, worker: int) -> None:
+        thread = Thread(target=self.__work, args=(worker,), name=f"{self.__thread_name_prefix}_{worker}", daemon=True)
+        self.__threads.append(thread)
+        thread.start()
+
+    def __wake(self, worker: int, count: int) -> None:
+        woken = 0
+        for candidate in [worker] + list(range(len(self.__threads))):
+            if woken == count:
+                return
+
+            if candidate < len(self.__threads) and self.__idle[candidate]:
+                self.__idle[candidate] = False
+                self.__wakeups[candidate].set()
+                woken += 1
+
+        # Not enough parked workers - start new ones, they steal the work as soon as they are up
+        if woken < count and len(self.__threads) < len(self.__deques):
+            with self.__lock:
+                while woken < count and len(self.__threads) < len(self.__deques):
+                    self.__start_worker(len(self.__threads))
+                    woken += 1
+
+    def __take(self, worker: int) -> Optional[Callable[[], None]]:
+        try:
+            return self.__deques[worker].popleft()
+        except IndexError:
+            pass
+
+        # Own deque is empty - steal up to half of another worker's deque from its back, so a large batch queued on
+        # one deque is spread out in a few steals rather than one steal per callable
+        workers = len(self.__deques)  # Includes deques of workers not started yet, submitters may have used them
+        for offset in range(1, workers):
+            victim = self.__deques[(worker + offset) % workers]
+            stolen = []
+            for _ in range(min(max(1, len(victim) // 2), self.STEAL_LIMIT)):
+                try:
+                    stolen.append(victim.pop())
+                except IndexError:
+                    break  # Lost a race with the owner or another thief
+
+            if stolen:
+                self.__deques[worker].extend(stolen[1:])  # Oldest first, run the rest before stealing again
+                return stolen[0]
+
+        return None
+
+    def __work(self, worker: int) -> None:
+        self.__submitter.worker = worker
+        wakeup = self.__wakeups[worker]
+        while True:
+            fn = self.__take(worker)
+            for _ in range(self.SPIN_ROUNDS):
+                if fn is not None:
+                    break
+                time.sleep(0)  # Yield the GIL so submitters can make progress while we spin
+                fn = self.__take(worker)
+
+            if fn is None:
+                # Advertise idleness before the final check so a concurrent push either sees us idle or we see its work
+                self.__idle[worker] = True
+                fn = self.__take(worker)
+                if fn is None:
+                    if self.__shutdown:
+                        return
+
+                    wakeup.wait()
+                    wakeup.clear()
+                    continue
+
+                self.__idle[worker] = False
+
+            try:
+                fn()
+            except Exception:
+                # Like concurrent.futures, a failing callable must not take the worker down with it
+                pass
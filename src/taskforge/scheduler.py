@@ -1,19 +1,50 @@
-from threading import Condition
-from collections import defaultdict, deque
-from .task import Task, TaskStatus
+from array import array
+from threading import Event, Lock
+from collections import deque
+from itertools import accumulate
+from .task import Task, TaskOutcome, TaskStatus, _PENDING, _SCHEDULED, _COMPLETED, _FAILED, _CANCELED
 from typing import Optional, Generator
 
 
+# Statuses of tasks that will not report an outcome anymore
+_FINISHED = frozenset({TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELED})
+
+
 class SchedulingException(Exception):
     pass
 
 
 class Scheduler:
+    __slots__ = (
+        '__task_to_dependencies', '__outcome_handlers', '__lock', '__wake', '__remaining', '__status', '__ready', '__pending',
+        '__cycles_detected', '__frozen', '__tasks', '__task_index', '__dependency_indptr', '__dependency_indices', '__dependent_indptr', '__dependent_indices'
+    )
+
     def __init__(self, tasks: Optional[set[Task]] = None) -> None:
-        # Track dependencies in both directions for efficient graph traversal
-        self.__task_to_dependencies: dict[Task, set[Task]] = defaultdict(set)  # Task -> set of its dependencies
-        self.__task_to_dependents: dict[Task, set[Task]] = defaultdict(set)  # Task -> set of tasks that depend on it
-        self.__condition = Condition()  # Threading condition for coordination between task state changes
+        # Dependents are not tracked while scheduling, __freeze derives them from the dependencies in one pass
+        self.__task_to_dependencies: dict[Task, tuple[Task, ...]] = {}  # Task -> tuple of its dependencies
+        self.__outcome_handlers = (self.__on_task_completed, self.__on_task_failed, self.__on_task_canceled)  # By TaskOutcome
+        self.__lock = Lock()  # Guards the dependency countdown against concurrent task callbacks
+        self.__wake = Event()  # Set by task callbacks whenever tasks are released, ready_tasks waits on it
+
+        # Tasks are numbered in scheduling order, the runtime state below is indexed by that number
+        self.__tasks: list[Task] = []  # Index -> Task
+        self.__task_index: dict[Task, int] = {}  # Task -> index
+
+        # Kahn-style bookkeeping: each task counts down its unfinished dependencies and is queued once it hits zero
+        self.__remaining: array = array('i')  # Index -> number of dependencies that have not finished yet
+        self.__status: bytearray = bytearray()  # Index -> status code as the scheduler last saw it, same codes as Task
+        self.__ready: deque[int] = deque()  # Indices of tasks whose dependencies have all finished, waiting to be yielded
+        self.__pending: int = 0  # Number of scheduled tasks that have not been yielded or canceled yet, guarded by __lock
+
+        self.__cycles_detected: Optional[bool] = None  # Cached __has_cycles result, None until checked or after schedule
+
+        # Integer-indexed CSR copy of the graph, built by __freeze once tasks start running
+        self.__frozen: bool = False
+        self.__dependency_indptr: array = array('i')  # Dependencies of task i are dependency_indices[indptr[i]:indptr[i + 1]]
+        self.__dependency_indices: array = array('i')
+        self.__dependent_indptr: array = array('i')  # Dependents of task i are dependent_indices[indptr[i]:indptr[i + 1]]
+        self.__dependent_indices: array = array('i')
 
         for task in tasks if tasks else set():
             self.schedule(task)
@@ -22,35 +53,155 @@ class Scheduler:
         if task in self.__task_to_dependencies:
             raise SchedulingException(f"Task {task} already exists in the scheduler.")
 
-        # Register callbacks for task state changes
-        task.register_on_task_completed(self.__on_task_completed)
-        task.register_on_task_failed(self.__on_task_failed)
-        task.register_on_task_canceled(self.__on_task_canceled)
+        # Have the task report its outcome back to this scheduler
+        task.bind_scheduler(self)
 
-        # Build bidirectional dependency graph
-        self.__task_to_dependencies[task] = set(task.dependencies)
-        for dependency in task.dependencies:
-            self.__task_to_dependents[dependency].add(task)
+        # Under the lock, so tasks finishing meanwhile count down the new task only once it is fully registered
+        with self.__lock:
+            index = len(self.__tasks)
+            self.__task_to_dependencies[task] = task.dependencies
+            self.__tasks.append(task)
+            self.__task_index[task] = index
+            self.__frozen = False
+            self.__cycles_detected = None
 
-    def __on_task_completed(self, task: Task) -> None:
-        with self.__condition:
-            self.__condition.notify_all()  # Wake up ready_tasks iterator to check for newly available tasks
+            # Dependencies that have already finished never report back, so only the unfinished ones are counted
+            remaining = sum(1 for dependency in task.dependencies if dependency.status not in _FINISHED)
+            self.__remaining.append(remaining)
+            if task.status == TaskStatus.PENDING:
+                self.__status.append(_PENDING)
+                self.__pending += 1
+                if not remaining:
+                    self.__ready.append(index)
+                    self.__wake.set()  # May be scheduled while ready_tasks is waiting
+            else:
+                self.__status.append(_SCHEDULED)  # Handed out elsewhere, never ours to yield
 
-    def __on_task_failed(self, task: Task) -> None:
-        # Cancel all dependent tasks when a dependency fails
-        for dependent in self.__task_to_dependents[task]:
-            dependent.cancel()
+    def __freeze(self) -> None:
+        """
+        Packs the dependency graph into integer-indexed CSR (compressed sparse row) arrays.
+        Rebuilt only if tasks were scheduled since the last call, the graph no longer changes once tasks are running.
+        Raises SchedulingException if a task depends on a task that was never scheduled.
+        """
+        if self.__frozen:
+            return
+
+        tasks, task_index = self.__tasks, self.__task_index
+
+        dependency_indptr, dependency_indices = array('i', [0]), array('i')
+        dependent_counts = [0] * len(tasks)
+        for task in tasks:
+            for dependency in self.__task_to_dependencies[task]:
+                if dependency not in task_index:
+                    raise SchedulingException(f"Task {task} depends on task {dependency} which is not scheduled.")
+                dependency_indices.append(task_index[dependency])
+                dependent_counts[task_index[dependency]] += 1
+            dependency_indptr.append(len(dependency_indices))
+
+        # Dependents are the transpose: prefix-sum the counts into row boundaries, then drop every edge into its row
+        dependent_indptr = array('i', accumulate(dependent_counts, initial=0))
+        dependent_indices = array('i', [0]) * len(dependency_indices)
+        next_slot = dependent_indptr[:-1]
+        for index in range(len(tasks)):
+            for dependency in dependency_indices[dependency_indptr[index]:dependency_indptr[index + 1]]:
+                dependent_indices[next_slot[dependency]] = index
+                next_slot[dependency] += 1
+
+        self.__dependency_indptr, self.__dependency_indices = dependency_indptr, dependency_indices
+        self.__dependent_indptr, self.__dependent_indices = dependent_indptr, dependent_indices
+        self.__frozen = True
+
+    def __dependents(self, index: int) -> array:
+        self.__freeze()
+        return self.__dependent_indices[self.__dependent_indptr[index]:self.__dependent_indptr[index + 1]]
+
+    def __release_dependents(self, index: int) -> None:
+        # Count the completed task off each dependent; a dependent becomes ready once nothing is left to wait for.
+        # Runs on ints only: counts and status codes are read from arrays rather than from the Task objects.
+        remaining, status = self.__remaining, self.__status
+        released = False
+        for dependent in self.__dependents(index):
+            remaining[dependent] -= 1
+            if remaining[dependent] == 0 and status[dependent] == _PENDING:
+                self.__ready.append(dependent)
+                released = True
+
+        if released:
+            self.__wake.set()  # Wake up ready_tasks iterator once for the whole batch of newly available tasks
+
+    def __cancel_dependents(self, root: int) -> None:
+        """
+        Cancels every task that transitively depends on the given one, in a single BFS over the CSR graph.
+        None of them can have been handed out yet, so they are marked canceled directly instead of being run to cancel.
+        """
+        self.__freeze()
+        tasks, status = self.__tasks, self.__status
+        dependent_indptr, dependent_indices = self.__dependent_indptr, self.__dependent_indices
+
+        queue = deque([root])
+        canceled_count = 0
+        while queue:
+            index = queue.popleft()
+            for dependent in dependent_indices[dependent_indptr[index]:dependent_indptr[index + 1]]:
+                # Already canceled earlier in this walk or by another failure, together with everything that depends on it.
+                # Tasks are marked before they are queued, so this also keeps the walk from visiting a task twice.
+                if status[dependent] != _PENDING:
+                    continue
+
+                status[dependent] = _CANCELED
+                tasks[dependent].mark_as_canceled()
+                canceled_count += 1
+                queue.append(dependent)
+
+        if canceled_count:
+            self.__pending -= canceled_count
+            self.__wake.set()  # Wake up ready_tasks iterator, it may have nothing left to wait for
 
-        with self.__condition:
-            self.__condition.notify_all()
+    def _on_outcome(self, task: Task, outcome: TaskOutcome) -> None:
+        """
+        Called by a task once its execution has ended.
+        """
+        self.__outcome_handlers[outcome](self.__task_index[task])
+
+    def __on_task_completed(self, index: int) -> None:
+        with self.__lock:
+            self.__status[index] = _COMPLETED
+            self.__release_dependents(index)
 
-    def __on_task_canceled(self, task: Task) -> None:
+    def __on_task_failed(self, index: int) -> None:
+        # Cancel all dependent tasks when a dependency fails
+        with self.__lock:
+            self.__status[index] = _FAILED
+            self.__cancel_dependents(index)
+
+    def __on_task_canceled(self, index: int) -> None:
         # Propagate cancellation to all dependent tasks
-        for dependent in self.__task_to_dependents[task]:
-            dependent.cancel()
+        with self.__lock:
+            self.__status[index] = _CANCELED
+            self.__cancel_dependents(index)
+
+    def __ensure_acyclic(self) -> None:
+        # The graph only changes in schedule(), so repeated ready_tasks calls reuse the previous check
+        if self.__cycles_detected is None:
+            self.__cycles_detected = self.__has_cycles()
+
+        if self.__cycles_detected:
+            raise SchedulingException("Dependency graph contains circular dependencies")
+
+    def __await_ready(self) -> bool:
+        """
+        Blocks until a task is ready. Returns False once every scheduled task has been handed out.
+        """
+        while not self.__ready:
+            if not self.__pending:
+                return False
+
+            # No tasks are ready - wait for task state changes. Clearing after the wakeup is safe because
+            # a task released before the clear is already in the ready queue when it is checked again.
+            self.__wake.wait()
+            self.__wake.clear()
 
-        with self.__condition:
-            self.__condition.notify_all()
+        return True
 
     @property
     def ready_tasks(self) -> Generator[Task, None, None]:
@@ -59,38 +210,42 @@ class Scheduler:
         Blocks until tasks become ready or all tasks are processed.
         Raises SchedulingException if circular dependencies are detected.
         """
-        if self.__has_cycles():
-            raise SchedulingException("Dependency graph contains circular dependencies")
+        self.__ensure_acyclic()
+
+        # Hand out tasks in the order they became ready, only waiting once none are left
+        while self.__await_ready():
+            task = self.__hand_out(self.__ready.popleft())
+            with self.__lock:
+                self.__pending -= 1
+            yield task
+
+    @property
+    def ready_batches(self) -> Generator[list[Task], None, None]:
+        """
+        Same as ready_tasks, but yields lists holding every task that became ready since the previous list.
+        Lets callers submit tasks in bulk instead of one at a time.
+        """
+        self.__ensure_acyclic()
 
-        with self.__condition:
-            while True:
-                # Check if there are any remaining pending tasks
-                has_pending_tasks = any(task.status == TaskStatus.PENDING for task in self.__task_to_dependencies.keys())
-                if not has_pending_tasks:
-                    return
-
-                # Find a task whose dependencies are all completed
-                ready_tasks = []
-                for task, dependencies in self.__task_to_dependencies.items():
-                    if task.status != TaskStatus.PENDING:
-                        continue
-
-                    # Check if all dependencies are completed (not running, pending, or scheduled)
-                    all_dependencies_completed = all(
-                        (dependency.status in {TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELED})
-                        for dependency in dependencies
-                    )
-
-                    if all_dependencies_completed:
-                        ready_tasks.append(task)
-
-                if ready_tasks:
-                    for task in ready_tasks:
-                        task.mark_as_scheduled()
-                        yield task
-                else:
-                    # No tasks are ready - wait for task state changes
-                    self.__condition.wait()
+        while self.__await_ready():
+            yield self.__take_ready()
+
+    def __take_ready(self) -> list[Task]:
+        # Hands out every task that is currently ready in one list, marked as scheduled
+        batch = []
+        while self.__ready:
+            batch.append(self.__hand_out(self.__ready.popleft()))
+
+        with self.__lock:
+            self.__pending -= len(batch)
+
+        return batch
+
+    def __hand_out(self, index: int) -> Task:
+        self.__status[index] = _SCHEDULED
+        task = self.__tasks[index]
+        task.mark_as_scheduled()
+        return task
 
     def __has_cycles(self) -> bool:
         """
@@ -100,21 +255,27 @@ class Scheduler:
         and updating the dependency counts of their dependents. If we can't
         process all nodes this way, there must be a cycle.
         """
-        out_degree = {task: len(dependencies) for task, dependencies in self.__task_to_dependencies.items()}
+        self.__freeze()
+        task_count = len(self.__tasks)
+        dependency_indptr = self.__dependency_indptr
+        dependent_indptr, dependent_indices = self.__dependent_indptr, self.__dependent_indices
+
+        # Number of unprocessed dependencies per task, read straight off the CSR row boundaries
+        in_degree = array('i', [end - start for start, end in zip(dependency_indptr, dependency_indptr[1:])])
 
         # Start with tasks that have no dependencies
-        ready_queue = deque(task for task, degree in out_degree.items() if degree == 0)
+        ready_queue = deque(index for index in range(task_count) if in_degree[index] == 0)
 
         processed_count = 0
         while ready_queue:
-            task = ready_queue.popleft()
+            index = ready_queue.popleft()
             processed_count += 1
 
             # Reduce the dependency count for each dependent task
-            for dependent in self.__task_to_dependents[task]:
-                out_degree[dependent] -= 1
-                if out_degree[dependent] == 0:
+            for dependent in dependent_indices[dependent_indptr[index]:dependent_indptr[index + 1]]:
+                in_degree[dependent] -= 1
+                if in_degree[dependent] == 0:
                     ready_queue.append(dependent)
 
         # If we couldn't process all tasks, there must be a cycle
-        return processed_count != len(self.__task_to_dependencies)
\ No newline at end of file
+        return processed_count != task_count
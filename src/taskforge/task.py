@@ -1,9 +1,12 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
+from itertools import count
 from uuid import uuid4
-from typing import Optional, Callable
-from threading import Event
-from enum import Enum
+from typing import Optional, Iterable, Union, TYPE_CHECKING
+from enum import Enum, IntEnum
+
+if TYPE_CHECKING:
+    from .scheduler import Scheduler
 
 
 class TaskStatus(Enum):
@@ -15,23 +18,49 @@ class TaskStatus(Enum):
     CANCELED = 'canceled'
 
 
+class TaskOutcome(IntEnum):
+    """
+    How a task execution ended, reported to the owning scheduler.
+    """
+    COMPLETED = 0
+    FAILED = 1
+    CANCELED = 2
+
+
+# Task state is a single int: the low bits hold the status code, the cancel bit is set once the task is canceled
+_PENDING, _SCHEDULED, _RUNNING, _COMPLETED, _FAILED, _CANCELED = range(6)
+_STATUS_MASK = 0b0111
+_CANCEL_BIT = 0b1000
+_STATUSES = (
+    TaskStatus.PENDING, TaskStatus.SCHEDULED, TaskStatus.RUNNING,
+    TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELED
+)  # Status code -> TaskStatus
+
+# Process-wide source of ids for tasks created without an explicit task_id
+_task_ids = count()
+
+# Random per-process prefix applied by Task.task_id, keeps generated ids from reading like caller-supplied ones
+_GENERATED_ID_PREFIX = f"{uuid4()}-"
+
+
 class Task(ABC):
     """
     Represents a unit of work with dependencies on other tasks.
     The task transitions through states: PENDING -> SCHEDULED -> RUNNING -> [COMPLETED|FAILED|CANCELED].
     """
-
-    def __init__(self, dependencies: Optional[set[Task]] = None, task_id: Optional[str] = None):
-        self.__task_id: str = task_id if task_id else str(uuid4())
-        self.__task_status: TaskStatus = TaskStatus.PENDING
-        self.__dependencies: frozenset[Task] = frozenset(dependencies) if dependencies else frozenset()
+    __slots__ = (
+        '__task_id', '__state', '__dependencies', '__task_result', '__scheduler'
+    )
+
+    def __init__(self, dependencies: Optional[Iterable[Task]] = None, task_id: Optional[str] = None):
+        # Generated ids stay ints (cheap to create and hash) and never equal a caller-supplied string id;
+        # the task_id property renders them with _GENERATED_ID_PREFIX so their text does not clash either.
+        # Neither needs its hash cached on the task: ints hash to themselves and str caches its own hash.
+        self.__task_id: Union[int, str] = task_id if task_id else next(_task_ids)
+        self.__state: int = _PENDING  # Status code | _CANCEL_BIT
+        self.__dependencies: tuple[Task, ...] = tuple(dict.fromkeys(dependencies)) if dependencies else ()  # Deduplicated, in order
         self.__task_result: Optional[object] = None
-
-        self.__canceled_event: Event = Event()
-
-        self.__on_task_completed: Optional[Callable[[Task], None]] = None
-        self.__on_task_canceled: Optional[Callable[[Task], None]] = None
-        self.__on_task_failed: Optional[Callable[[Task], None]] = None
+        self.__scheduler: Optional[Scheduler] = None  # Owning scheduler, notified once execution ends
 
     @abstractmethod
     def execute(self) -> object:
@@ -51,31 +80,30 @@ class Task(ABC):
     def execute_task(self):
         """
         Internal method to handle actual task execution.
-        Manages status transitions and calls the appropriate callbacks.
+        Manages status transitions and reports the outcome to the owning scheduler.
         """
-        if self.__canceled_event.is_set():
-            self.__task_status = TaskStatus.CANCELED
-            if self.__on_task_canceled:
-                self.__on_task_canceled(self)
-            return
-
-        self.__task_status = TaskStatus.RUNNING
-        try:
-            self.__task_result = self.execute()
-            self.__task_status = TaskStatus.COMPLETED
-            if self.__on_task_completed:
-                self.__on_task_completed(self)
-        except Exception as exception:
-            self.__task_result = exception
-            self.__task_status = TaskStatus.FAILED
-            if self.__on_task_failed:
-                self.__on_task_failed(self)
+        if self.__state & _CANCEL_BIT:
+            self.__state = _CANCELED | _CANCEL_BIT
+            outcome = TaskOutcome.CANCELED
+        else:
+            self.__state = _RUNNING
+            try:
+                self.__task_result = self.execute()
+                self.__state = _COMPLETED
+                outcome = TaskOutcome.COMPLETED
+            except Exception as exception:
+                self.__task_result = exception
+                self.__state = _FAILED
+                outcome = TaskOutcome.FAILED
+
+        if self.__scheduler is not None:
+            self.__scheduler._on_outcome(self, outcome)
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Task):
             return False
 
-        return self.__task_id == other.task_id
+        return self.__task_id == other.__task_id
 
     def __hash__(self) -> int:
         return hash(self.__task_id)
@@ -84,15 +112,15 @@ class Task(ABC):
         """
         Cancels the task.
         """
-        self.__canceled_event.set()
+        self.__state |= _CANCEL_BIT
 
     @property
-    def dependencies(self) -> frozenset[Task]:
+    def dependencies(self) -> tuple[Task, ...]:
         return self.__dependencies
 
     @property
     def status(self) -> TaskStatus:
-        return self.__task_status
+        return _STATUSES[self.__state & _STATUS_MASK]
 
     @property
     def result(self) -> Optional[object]:
@@ -100,22 +128,23 @@ class Task(ABC):
 
     @property
     def task_id(self) -> str:
-        return self.__task_id
+        task_id = self.__task_id
+        return task_id if isinstance(task_id, str) else f"{_GENERATED_ID_PREFIX}{task_id}"
 
     def mark_as_scheduled(self) -> None:
-        self.__task_status = TaskStatus.SCHEDULED
+        self.__state = (self.__state & _CANCEL_BIT) | _SCHEDULED
 
-    def register_on_task_completed(self, func: Callable[[Task], None]) -> None:
-        self.__on_task_completed = func
+    def mark_as_canceled(self) -> None:
+        self.__state = _CANCELED | _CANCEL_BIT
 
-    def register_on_task_failed(self, func: Callable[[Task], None]) -> None:
-        self.__on_task_failed = func
-
-    def register_on_task_canceled(self, func: Callable[[Task], None]) -> None:
-        self.__on_task_canceled = func
+    def bind_scheduler(self, scheduler: Scheduler) -> None:
+        """
+        Sets the scheduler whose _on_outcome is called once the task has been executed.
+        """
+        self.__scheduler = scheduler
 
     def __repr__(self) -> str:
-        return  (f"Task(task_id={self.__task_id!r}, "
-                f"task_status={self.__task_status.value!r}, "
+        return  (f"Task(task_id={self.task_id!r}, "
+                f"task_status={self.status.value!r}, "
                 f"task_result={self.__task_result}, "
                 f"dependencies={[dependency.task_id for dependency in self.__dependencies]!r})")
\ No newline at end of file
@@ -38,6 +38,12 @@ class MockTask(Task):
             return self.__tag
 
         return super().tag()
+
+
+class UntaggedMockTask(MockTask):
+
+    def tag(self):
+        return None
         
 
 class ExecutorTest(unittest.TestCase):
@@ -71,8 +77,8 @@ class ExecutorTest(unittest.TestCase):
 
         assert execution_time >= 0.3
 
-        for pool in self.__executor._Executor__tag_to_thread_pool.values():
-            self.assertTrue(pool._shutdown)
+        for pool in self.__executor._Executor__tag_to_pool.values():
+            self.assertTrue(pool._WorkStealingPool__shutdown)
 
 
     def test_parallel_execution(self):
@@ -102,8 +108,8 @@ class ExecutorTest(unittest.TestCase):
         for task in [task1, task2, task3, task4, task5, task6, task7]:
             assert task.status == TaskStatus.COMPLETED
 
-        for pool in self.__executor._Executor__tag_to_thread_pool.values():
-            self.assertTrue(pool._shutdown)
+        for pool in self.__executor._Executor__tag_to_pool.values():
+            self.assertTrue(pool._WorkStealingPool__shutdown)
 
 
     def test_per_tag_parallel_execution(self):
@@ -126,8 +132,67 @@ class ExecutorTest(unittest.TestCase):
         for task in [task1, task2, task3, task4, task5, task6]:
             assert task.status == TaskStatus.COMPLETED
 
-        for pool in self.__executor._Executor__tag_to_thread_pool.values():
-            self.assertTrue(pool._shutdown)
+        for pool in self.__executor._Executor__tag_to_pool.values():
+            self.assertTrue(pool._WorkStealingPool__shutdown)
+
+
+    def test_none_tag(self):
+        task1 = UntaggedMockTask()
+        task2 = UntaggedMockTask(dependencies={task1})
+        task3 = MockTask(dependencies={task2})
+
+        for task in [task1, task2, task3]:
+            self.__scheduler.schedule(task)
+
+        self.__executor.run()
+
+        for task in [task1, task2, task3]:
+            assert task.status == TaskStatus.COMPLETED
+        self.assertEqual({None, "default"}, set(self.__executor._Executor__tag_to_pool))
+
+
+    def test_workers_per_tag_limit_is_respected(self):
+        executor = Executor(scheduler=self.__scheduler, workers_per_tag=1)
+        task1 = MockTask(execution_time=0.1)
+        task2 = MockTask(execution_time=0.1)
+
+        for task in [task1, task2]:
+            self.__scheduler.schedule(task)
+
+        start_time = time.time()
+        executor.run()
+        execution_time = time.time() - start_time
+
+        assert execution_time >= 0.2
+        for task in [task1, task2]:
+            assert task.status == TaskStatus.COMPLETED
+
+        for pool in executor._Executor__tag_to_pool.values():
+            self.assertTrue(pool._WorkStealingPool__shutdown)
+            self.assertEqual(1, len(pool._WorkStealingPool__threads))
+
+
+    def test_long_task_does_not_delay_other_tags(self):
+        # TAG1: task1, task2 (long)    TAG2: chain1 -> chain2 -> ... -> chain8
+        executor = Executor(scheduler=self.__scheduler, workers_per_tag=1)
+        task1 = MockTask(execution_time=0.1, tag="TAG1")
+        task2 = MockTask(execution_time=1.0, tag="TAG1")
+
+        chain = [MockTask(execution_time=0.1, tag="TAG2")]
+        for _ in range(7):
+            chain.append(MockTask(execution_time=0.1, tag="TAG2", dependencies={chain[-1]}))
+
+        for task in [task1, task2] + chain:
+            self.__scheduler.schedule(task)
+
+        start_time = time.time()
+        executor.run()
+        execution_time = time.time() - start_time
+
+        # TAG1 alone needs 1.1s, the TAG2 chain finishes alongside it
+        assert execution_time < 1.4
+        for task in [task1, task2] + chain:
+            assert task.status == TaskStatus.COMPLETED
 
 
     def test_tasks_cascading_cancellation_if_dependencies_fail(self):
@@ -161,5 +226,5 @@ class ExecutorTest(unittest.TestCase):
             assert task.result is None
             assert task.status == TaskStatus.CANCELED
 
-        for pool in self.__executor._Executor__tag_to_thread_pool.values():
-            self.assertTrue(pool._shutdown)
\ No newline at end of file
+        for pool in self.__executor._Executor__tag_to_pool.values():
+            self.assertTrue(pool._WorkStealingPool__shutdown)
\ No newline at end of file
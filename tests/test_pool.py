@@ -0,0 +1,153 @@
+import sys
+import threading
+import time
+import unittest
+
+from src.taskforge.pool import WorkStealingPool
+
+
+class WorkStealingPoolTest(unittest.TestCase):
+
+
+    def setUp(self):
+        self.__pool = WorkStealingPool(max_workers=3, thread_name_prefix="test")
+
+
+    def tearDown(self):
+        self.__pool.shutdown()
+
+
+    def test_pushed_work_is_executed(self):
+        results = []
+        for i in range(100):
+            self.__pool.push(lambda i=i: results.append(i))
+
+        self.__pool.shutdown()
+
+        self.assertEqual(list(range(100)), sorted(results))
+
+
+    def test_idle_workers_run_work_in_parallel(self):
+        thread_names = set()
+
+        def work():
+            thread_names.add(threading.current_thread().name)
+            time.sleep(0.1)
+
+        start_time = time.time()
+        for _ in range(3):
+            self.__pool.push(work)
+
+        self.__pool.shutdown()
+        execution_time = time.time() - start_time
+
+        assert execution_time < 0.2
+        self.assertEqual({"test_0", "test_1", "test_2"}, thread_names)
+
+
+    def test_push_many_is_spread_across_workers(self):
+        thread_names = set()
+
+        def work():
+            thread_names.add(threading.current_thread().name)
+            time.sleep(0.1)
+
+        start_time = time.time()
+        self.__pool.push_many([work, work, work])
+
+        self.__pool.shutdown()
+        execution_time = time.time() - start_time
+
+        assert execution_time < 0.2
+        self.assertEqual({"test_0", "test_1", "test_2"}, thread_names)
+
+
+    def test_each_submitter_keeps_its_own_deque(self):
+        submitter_worker = self.__pool._WorkStealingPool__submitter_worker
+        workers = []
+
+        thread = threading.Thread(target=lambda: workers.extend([submitter_worker(), submitter_worker()]))
+        thread.start()
+        thread.join()
+        workers.append(submitter_worker())
+
+        self.assertEqual([0, 0, 1], workers)
+
+
+    def test_steal_takes_half_of_the_victim_deque(self):
+        deques = self.__pool._WorkStealingPool__deques
+        deques[0].extend(range(10))
+
+        self.assertEqual(9, self.__pool._WorkStealingPool__take(1))
+        self.assertEqual([8, 7, 6, 5], list(deques[1]))
+        self.assertEqual([0, 1, 2, 3, 4], list(deques[0]))
+
+        deques[0].clear()
+        deques[1].clear()
+
+
+    def test_workers_are_started_on_demand(self):
+        self.assertEqual(0, len(self.__pool._WorkStealingPool__threads))
+
+        self.__pool.push(lambda: None)
+        self.__pool.shutdown()
+
+        self.assertEqual(1, len(self.__pool._WorkStealingPool__threads))
+
+
+    def test_concurrent_submitters_start_at_most_max_workers(self):
+        # Switch threads as often as possible so racing submitters actually interleave
+        self.addCleanup(sys.setswitchinterval, sys.getswitchinterval())
+        sys.setswitchinterval(1e-6)
+
+        for _ in range(50):
+            pool = WorkStealingPool(max_workers=3, thread_name_prefix="race")
+            barrier = threading.Barrier(6)
+            errors = []
+
+            def submit():
+                barrier.wait()
+                try:
+                    pool.push(lambda: None)
+                except Exception as exception:
+                    errors.append(exception)
+
+            submitters = [threading.Thread(target=submit) for _ in range(6)]
+            for submitter in submitters:
+                submitter.start()
+            for submitter in submitters:
+                submitter.join()
+            pool.shutdown()
+
+            thread_names = [thread.name for thread in pool._WorkStealingPool__threads]
+            self.assertEqual([], errors)
+            self.assertLessEqual(len(thread_names), 3)
+            self.assertEqual(len(thread_names), len(set(thread_names)))
+
+
+    def test_failing_work_does_not_stop_workers(self):
+        results = []
+
+        def fail():
+            raise Exception("Failed!")
+
+        for _ in range(3):
+            self.__pool.push(fail)
+        self.__pool.push(lambda: results.append("done"))
+
+        self.__pool.shutdown()
+
+        self.assertEqual(["done"], results)
+
+
+    def test_push_after_shutdown(self):
+        self.__pool.shutdown()
+
+        with self.assertRaises(RuntimeError):
+            self.__pool.push(lambda: None)
+
+
+    def test_max_workers_must_be_positive(self):
+        for max_workers in [0, -1]:
+            with self.assertRaises(ValueError):
+                WorkStealingPool(max_workers=max_workers)
@@ -1,8 +1,6 @@
 import random
 import unittest
 
-from collections import defaultdict
-
 from src.taskforge.task import Task, TaskStatus
 from src.taskforge.scheduler import Scheduler, SchedulingException
 
@@ -25,8 +23,9 @@ class TestScheduler(unittest.TestCase):
 
 
     def test_scheduler_initial_state(self):
-        self.assertEqual(defaultdict(set), self.__scheduler._Scheduler__task_to_dependencies)
-        self.assertEqual(defaultdict(set), self.__scheduler._Scheduler__task_to_dependents)
+        self.assertEqual({}, self.__scheduler._Scheduler__task_to_dependencies)
+        self.assertEqual([], self.__scheduler._Scheduler__tasks)
+        self.assertFalse(self.__scheduler._Scheduler__frozen)
 
 
     def test_duplicate_task_scheduling(self):
@@ -48,10 +47,12 @@ class TestScheduler(unittest.TestCase):
         self.__scheduler.schedule(task2)
         self.__scheduler.schedule(task3)
 
-        self.assertEqual({task1, task2}, self.__scheduler._Scheduler__task_to_dependencies[task3])
+        self.assertEqual({task1, task2}, set(self.__scheduler._Scheduler__task_to_dependencies[task3]))
 
-        self.assertIn(task3, self.__scheduler._Scheduler__task_to_dependents[task1])
-        self.assertIn(task3, self.__scheduler._Scheduler__task_to_dependents[task2])
+        # Tasks are indexed in scheduling order
+        self.assertEqual([2], list(self.__scheduler._Scheduler__dependents(0)))
+        self.assertEqual([2], list(self.__scheduler._Scheduler__dependents(1)))
+        self.assertEqual([], list(self.__scheduler._Scheduler__dependents(2)))
 
 
     def test_cycle_detection_simple(self):
@@ -73,6 +74,76 @@ class TestScheduler(unittest.TestCase):
         self.assertIn("circular dependencies", str(context.exception))
 
 
+    def test_cycle_detection_long_chain(self):
+        # task0 -> task1 -> ... -> task9999 -> task0
+        tasks = [MockTask()]
+        for _ in range(9999):
+            tasks.append(MockTask(dependencies={tasks[-1]}))
+
+        tasks[0]._Task__dependencies = (tasks[-1],)
+
+        for task in tasks:
+            self.__scheduler.schedule(task)
+
+        with self.assertRaises(SchedulingException) as context:
+            next(self.__scheduler.ready_tasks)
+        self.assertIn("circular dependencies", str(context.exception))
+
+
+    def test_cycle_detection_result_is_cached(self):
+        task1 = MockTask()
+        task2 = MockTask(dependencies={task1})
+
+        self.__scheduler.schedule(task1)
+        self.assertIsNone(self.__scheduler._Scheduler__cycles_detected)
+
+        next(self.__scheduler.ready_tasks)
+        self.assertFalse(self.__scheduler._Scheduler__cycles_detected)
+
+        self.__scheduler.schedule(task2)
+        self.assertIsNone(self.__scheduler._Scheduler__cycles_detected)
+
+
+    def test_dependency_finished_before_scheduling(self):
+        task1 = MockTask()
+        task1.execute_task()
+        task2 = MockTask(dependencies={task1})
+
+        self.__scheduler.schedule(task1)
+        self.__scheduler.schedule(task2)
+
+        # Checked before iterating, so a regression fails here instead of blocking in ready_tasks
+        self.assertEqual([1], list(self.__scheduler._Scheduler__ready))
+        self.assertEqual([task2], list(self.__scheduler.ready_tasks))
+
+
+    def test_task_scheduled_during_run_on_finished_dependency(self):
+        task1 = MockTask()
+        task2 = MockTask(dependencies={task1})
+
+        self.__scheduler.schedule(task1)
+
+        ready_tasks = self.__scheduler.ready_tasks
+        self.assertIs(task1, next(ready_tasks))
+        task1.execute_task()
+
+        self.__scheduler.schedule(task2)
+
+        self.assertEqual([1], list(self.__scheduler._Scheduler__ready))
+        self.assertEqual([task2], list(ready_tasks))
+
+
+    def test_unscheduled_dependency(self):
+        task1 = MockTask()
+        task2 = MockTask(dependencies={task1})
+
+        self.__scheduler.schedule(task2)
+
+        with self.assertRaises(SchedulingException) as context:
+            next(self.__scheduler.ready_tasks)
+        self.assertIn("not scheduled", str(context.exception))
+
+
     def test_task_execution_order_1(self):
         task1 = MockTask()
         task2 = MockTask()
@@ -151,6 +222,31 @@ class TestScheduler(unittest.TestCase):
         self.assertTrue(all(task.status == TaskStatus.SCHEDULED for task in tasks))
 
 
+    def test_ready_batches(self):
+        #      task1
+        #    /   |   \
+        # task2 task3 task4
+        task1 = MockTask()
+        task2 = MockTask(dependencies={task1})
+        task3 = MockTask(dependencies={task1})
+        task4 = MockTask(dependencies={task1})
+
+        for task in [task1, task2, task3, task4]:
+            self.__scheduler.schedule(task)
+
+        ready_batches = self.__scheduler.ready_batches
+        self.assertEqual([task1], next(ready_batches))
+
+        task1.execute_task()
+
+        batch = next(ready_batches)
+        self.assertEqual({task2, task3, task4}, set(batch))
+        self.assertTrue(all(task.status == TaskStatus.SCHEDULED for task in batch))
+
+        with self.assertRaises(StopIteration):
+            next(ready_batches)
+
+
     def test_parallel_dependency_chains(self):
         # Chain 1: task1 -> task2 -> task3
         task1 = MockTask()
@@ -296,4 +392,50 @@ class TestScheduler(unittest.TestCase):
         assert task4.status == TaskStatus.FAILED
 
         for task in [task5, task6, task7]:
-            assert task.status == TaskStatus.CANCELED
\ No newline at end of file
+            assert task.status == TaskStatus.CANCELED
+
+
+    def test_failure_cancels_whole_chain_without_scheduling_it(self):
+        def execute():
+            raise Exception("Failed")
+
+        tasks = [MockTask()]
+        for _ in range(2000):
+            tasks.append(MockTask(dependencies={tasks[-1]}))
+
+        tasks[0].execute = execute
+
+        for task in tasks:
+            self.__scheduler.schedule(task)
+
+        scheduled_tasks = []
+        for task in self.__scheduler.ready_tasks:
+            scheduled_tasks.append(task)
+            task.execute_task()
+
+        self.assertEqual([tasks[0]], scheduled_tasks)
+        assert tasks[0].status == TaskStatus.FAILED
+        for task in tasks[1:]:
+            assert task.status == TaskStatus.CANCELED
+
+
+    def test_status_bytes_follow_task_outcomes(self):
+        def execute():
+            raise Exception("Failed")
+
+        task1 = MockTask()
+        task2 = MockTask()
+        task3 = MockTask(dependencies={task2})
+        task2.execute = execute
+
+        for task in [task1, task2, task3]:
+            self.__scheduler.schedule(task)
+
+        status = self.__scheduler._Scheduler__status
+        self.assertEqual(bytes([0, 0, 0]), bytes(status))
+
+        for task in self.__scheduler.ready_tasks:
+            self.assertEqual(1, status[self.__scheduler._Scheduler__task_index[task]])
+            task.execute_task()
+
+        self.assertEqual(bytes([3, 4, 5]), bytes(status))
@@ -1,99 +1,157 @@
+import copy
+import types
 import unittest
 
-from unittest.mock import Mock
+from src.taskforge.task import Task, TaskOutcome, TaskStatus
 
-from src.taskforge.task import Task, TaskStatus
 
+_RESULT = types.MappingProxyType({"key1": "value1", "key2": "value2"})
 
+
+# Test tasks add no state of their own; together with Task.__slots__ this keeps them free of a per-instance __dict__
 class MockTask(Task):
+    __slots__ = ()
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
 
     def execute(self):
-        return {"key1": "value1", "key2": "value2"}
+        return _RESULT
+
+
+class FailingMockTask(Task):
+    __slots__ = ()
+
+    def execute(self):
+        raise ValueError("Exception!!!")
+
+
+class TaggedMockTask(MockTask):
+    __slots__ = ()
+
+    def tag(self):
+        return "tag"
+
+
+class CallRecorder:
+    __slots__ = ('calls',)
+
+    def __init__(self):
+        self.calls = []
+
+
+    def __call__(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+
+
+    def assert_not_called(self):
+        assert not self.calls, f"Expected no calls, got {self.calls}"
+
+
+    def assert_called_once_with_same(self, *args):
+        # Identity instead of equality, so recorded tasks are not compared through Task.__eq__
+        assert len(self.calls) == 1, f"Expected one call, got {self.calls}"
+        called_args, called_kwargs = self.calls[0]
+        assert not called_kwargs and len(called_args) == len(args) and all(
+            called is expected for called, expected in zip(called_args, args)
+        ), f"Expected one call with {args}, got {self.calls}"
+
+
+class RecordingScheduler:
+    __slots__ = ('_on_outcome',)
+
+    def __init__(self):
+        self._on_outcome = CallRecorder()
+
+
+def _make_scheduler():
+    # Single place where the scheduler stand-in is built. Kept a plain recorder on purpose:
+    # Mock, and Mock(spec=...)/autospec even more so, costs far more to create than these tests need.
+    return RecordingScheduler()
 
 
 class TaskTest(unittest.TestCase):
 
 
-    def setUp(self):
-        self.__default_test_task = MockTask()
+    @classmethod
+    def setUpClass(cls):
+        # Built once per class and never mutated; every test works on its own copy
+        cls.prototype_task = MockTask()
 
-        self.__mocked_completed_callback = Mock()
-        self.__mocked_failed_callback = Mock()
-        self.__mocked_canceled_callback = Mock()
 
-        self.__default_test_task.register_on_task_completed(self.__mocked_completed_callback)
-        self.__default_test_task.register_on_task_failed(self.__mocked_failed_callback)
-        self.__default_test_task.register_on_task_canceled(self.__mocked_canceled_callback)
+    def setUp(self):
+        self.task = copy.copy(self.prototype_task)
+
+        # A fresh recorder per test is cheap and leaves no state shared between tests, so they can run in any order
+        self.scheduler = _make_scheduler()
+        self.task.bind_scheduler(self.scheduler)
 
 
     def test_task_initial_state(self):
-        assert self.__default_test_task.status == TaskStatus.PENDING
-        assert self.__default_test_task.dependencies == set()
-        assert self.__default_test_task.tag() == "default"
+        assert self.task.status == TaskStatus.PENDING
+        assert self.task.dependencies == ()
+        assert self.task.tag() == "default"
 
-        self.__mocked_completed_callback.assert_not_called()
-        self.__mocked_failed_callback.assert_not_called()
-        self.__mocked_canceled_callback.assert_not_called()
+        self.scheduler._on_outcome.assert_not_called()
 
 
     def test_task_successful_execution(self):
-        self.__default_test_task.execute_task()
+        self.task.execute_task()
 
-        assert self.__default_test_task.status == TaskStatus.COMPLETED
-        assert self.__default_test_task.result == {"key1": "value1", "key2": "value2"}
+        assert self.task.status == TaskStatus.COMPLETED
+        assert self.task.result == _RESULT
 
-        self.__mocked_completed_callback.assert_called_once_with(self.__default_test_task)
-        self.__mocked_failed_callback.assert_not_called()
-        self.__mocked_canceled_callback.assert_not_called()
+        self.scheduler._on_outcome.assert_called_once_with_same(self.task, TaskOutcome.COMPLETED)
 
 
     def test_task_failed_execution(self):
-        def execute():
-            raise ValueError("Exception!!!")
+        task = FailingMockTask()
+        task.bind_scheduler(self.scheduler)
 
-        self.__default_test_task.execute = execute
+        task.execute_task()
 
-        self.__default_test_task.execute_task()
+        assert task.status == TaskStatus.FAILED
+        assert isinstance(task.result, ValueError)
+        assert str(task.result) == "Exception!!!"
 
-        assert self.__default_test_task.status == TaskStatus.FAILED
-        assert isinstance(self.__default_test_task.result, ValueError)
-        assert str(self.__default_test_task.result) == "Exception!!!"
-
-        self.__mocked_completed_callback.assert_not_called()
-        self.__mocked_failed_callback.assert_called_once_with(self.__default_test_task)
-        self.__mocked_canceled_callback.assert_not_called()
+        self.scheduler._on_outcome.assert_called_once_with_same(task, TaskOutcome.FAILED)
 
 
     def test_task_cancellation(self):
-        self.__default_test_task.cancel()
-        self.__default_test_task.execute_task()
+        self.task.cancel()
+        self.task.execute_task()
 
-        assert self.__default_test_task.status == TaskStatus.CANCELED
-        assert self.__default_test_task.result is None
+        assert self.task.status == TaskStatus.CANCELED
+        assert self.task.result is None
 
-        self.__mocked_completed_callback.assert_not_called()
-        self.__mocked_failed_callback.assert_not_called()
-        self.__mocked_canceled_callback.assert_called_once_with(self.__default_test_task)
+        self.scheduler._on_outcome.assert_called_once_with_same(self.task, TaskOutcome.CANCELED)
 
 
-    def test_task_dependencies_and_tags(self):
-        def tag():
-            return "tag"
+    def test_task_cancellation_survives_scheduling(self):
+        self.task.cancel()
+        assert self.task.status == TaskStatus.PENDING
+
+        self.task.mark_as_scheduled()
+        assert self.task.status == TaskStatus.SCHEDULED
+
+        self.task.execute_task()
+        assert self.task.status == TaskStatus.CANCELED
+        self.scheduler._on_outcome.assert_called_once_with_same(self.task, TaskOutcome.CANCELED)
 
-        task1 = MockTask()
-        task2 = MockTask()
-        task3 = MockTask(dependencies={task1, task2, task1, task2})
 
-        task1.tag = tag
-        task2.tag = tag
+class TaskConstructionTest(unittest.TestCase):
+    # Tests that build their own tasks, kept apart from TaskTest so they do not pay for its setUp
 
-        assert task1.dependencies == set()
-        assert task2.dependencies == set()
-        assert task3.dependencies == {task1, task2}
+
+    def test_task_dependencies_and_tags(self):
+        task1 = TaggedMockTask()
+        task2 = TaggedMockTask()
+        task3 = MockTask(dependencies=[task1, task2, task1, task2])  # A set literal would dedupe before Task sees it
+
+        assert task1.dependencies == ()
+        assert task2.dependencies == ()
+        assert task3.dependencies == (task1, task2)
 
         assert task1.tag() == "tag"
         assert task2.tag() == "tag"
@@ -114,7 +172,7 @@ class TaskTest(unittest.TestCase):
         dependency = MockTask()
         task = MockTask(dependencies={dependency})
 
-        with self.assertRaises(Exception):
+        with self.assertRaises(AttributeError):
             task.dependencies.add(MockTask())
 
 
@@ -122,4 +180,11 @@ class TaskTest(unittest.TestCase):
         task1 = MockTask()
         task2 = MockTask()
 
-        assert task1 != task2
\ No newline at end of file
+        assert task1 != task2
+        assert task1.task_id != task2.task_id
+
+        # Generated ids do not read like the plain ids callers pass in
+        counter_value = task1.task_id.rsplit("-", 1)[1]
+        caller_task = MockTask(task_id=counter_value)
+        assert caller_task.task_id != task1.task_id
+        assert caller_task != task1
\ No newline at end of file